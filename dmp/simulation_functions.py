@@ -1,8 +1,14 @@
 import random
-import numpy as np
+from itertools import accumulate
 
-# Define the states variable at the top level
-states = ["Infected", "Symptomatic", "Infectious", "Hospitalized", "ICU", "Removed", "Recovered"]
+# Define the states variable at the top level (immutable, shared by every run)
+states = ("Infected", "Symptomatic", "Infectious", "Hospitalized", "ICU", "Removed", "Recovered")
+
+# Map each state name to its row/column in the matrices
+state_to_idx = {state: i for i, state in enumerate(states)}
+
+# Indices of the states that end a simulation
+terminal_state_indices = frozenset(state_to_idx[state] for state in ("Removed", "Recovered"))
 
 # # Define other default values and transition matrix
 # default_mean_time_interval = 5
@@ -32,74 +38,67 @@ default_initial_state = "Infected"
 # ]
 
 def run_simulation(transition_matrix, mean_time_interval_matrix, std_dev_time_interval_matrix, min_cutoff_matrix, max_cutoff_matrix, distribution_type_matrix, initial_state, desired_iterations, age, vaccination_status):
-    current_state = states.index(initial_state)
+    current_state = state_to_idx[initial_state]
     total_time_steps = 0
     simulation_data = []
     
     simulation_data.append([initial_state, total_time_steps])
 
+    # Precompute the cumulative transition weights of every source state once per run.
+    # Age and vaccination scale a whole row uniformly, so they cancel out once the
+    # row is normalized and do not change the transition probabilities.
+    cumulative_weights = [list(accumulate(row)) for row in transition_matrix]
+
     def transition():
         nonlocal current_state
-        age_multiplier = 1 + (age / 100)
-
-        # Adjust transition weights based on age and vaccination status
-        if vaccination_status == "Yes":
-            vaccination_multiplier = 0.8
-        else:
-            vaccination_multiplier = 1.0
 
-        original_weights = transition_matrix[current_state]
-        weighted_transition = [weight * age_multiplier * vaccination_multiplier for weight in original_weights]
-        
-        # Normalize the weights to ensure they sum up to 1
-        sum_weights = sum(weighted_transition)
-        normalized_weights = [weight / sum_weights for weight in weighted_transition]
+        next_state = random.choices(states, cum_weights=cumulative_weights[current_state])[0]
 
-        next_state = random.choices(states, weights=normalized_weights)[0]
-
-        current_state = states.index(next_state)
+        current_state = state_to_idx[next_state]
         return next_state
 
-    def sample_time_interval(mean_matrix, std_dev_matrix, min_matrix, max_matrix, distribution_matrix, current_state_index, next_state_index):
-        age_multiplier = 1 + (age / 100)
+    # Adjust time intervals based on age and vaccination status (fixed for the whole run)
+    age_multiplier = 1 + (age / 100)
+    if vaccination_status == "Yes":
+        vaccination_multiplier = 0.8
+    else:
+        vaccination_multiplier = 1.0
 
-        # Adjust time interval based on age and vaccination status
-        if vaccination_status == "Yes":
-            vaccination_multiplier = 0.8
+    def sample_time_interval(mean_matrix, std_dev_matrix, min_matrix, max_matrix, distribution_matrix, current_state_index, next_state_index):
+        # Read this transition's parameters once instead of on every rejected sample
+        distribution_type = distribution_matrix[current_state_index][next_state_index]
+        mean = mean_matrix[current_state_index][next_state_index]
+        std_dev = std_dev_matrix[current_state_index][next_state_index]
+        min_cutoff = min_matrix[current_state_index][next_state_index]
+        max_cutoff = max_matrix[current_state_index][next_state_index]
+
+        # Resolve the sampler and its arguments once; only the draw repeats on rejection
+        if distribution_type == 1:  # Normal distribution
+            sampler, sampler_args = random.normalvariate, (mean * age_multiplier * vaccination_multiplier, std_dev)
+        elif distribution_type == 2:  # Exponential distribution
+            sampler, sampler_args = random.expovariate, (1 / (mean * age_multiplier * vaccination_multiplier),)
+        elif distribution_type == 3:  # Uniform distribution
+            sampler, sampler_args = random.uniform, (min_cutoff * age_multiplier * vaccination_multiplier, max_cutoff * age_multiplier * vaccination_multiplier)
         else:
-            vaccination_multiplier = 1.0
+            raise ValueError(f"Unsupported distribution type {distribution_type}")
+
         while True:
-            if distribution_matrix[current_state_index][next_state_index] == 1:  # Normal distribution
-                interval = int(random.normalvariate(
-                    mean_matrix[current_state_index][next_state_index] * age_multiplier * vaccination_multiplier,
-                    std_dev_matrix[current_state_index][next_state_index]
-                ))
-            elif distribution_matrix[current_state_index][next_state_index] == 2:  # Exponential distribution
-                interval = int(random.expovariate(
-                    1 / (mean_matrix[current_state_index][next_state_index] * age_multiplier * vaccination_multiplier)
-                ))
-            elif distribution_matrix[current_state_index][next_state_index] == 3:  # Uniform distribution
-                interval = int(random.uniform(
-                    min_matrix[current_state_index][next_state_index] * age_multiplier * vaccination_multiplier,
-                    max_matrix[current_state_index][next_state_index] * age_multiplier * vaccination_multiplier
-                ))
-            else:
-                raise ValueError(f"Unsupported distribution type {distribution_matrix[current_state_index][next_state_index]}")
+            interval = int(sampler(*sampler_args))
             
-            if min_matrix[current_state_index][next_state_index] <= interval <= max_matrix[current_state_index][next_state_index]:
+            if min_cutoff <= interval <= max_cutoff:
                 return interval
 
     iterations = 0
     while iterations < desired_iterations:
         next_state = transition()
-        next_state_index = states.index(next_state)  # convert next_state to its index
+        next_state_index = state_to_idx[next_state]  # convert next_state to its index
         time_interval = sample_time_interval(mean_time_interval_matrix, std_dev_time_interval_matrix, min_cutoff_matrix, max_cutoff_matrix, distribution_type_matrix, current_state, next_state_index) * 60 * 24
         total_time_steps += time_interval
         current_state_str = states[current_state]
 
         simulation_data.append([current_state_str, total_time_steps])
 
-        if states[current_state] in ["Removed", "Recovered"]:
+        if current_state in terminal_state_indices:
             break
 
         iterations += 1
@@ -1,6 +1,4 @@
 import pandas as pd
-import numpy as np
-import csv
 from simulation_functions import run_simulation, default_initial_state
 # , states, default_mean_time_interval, default_std_dev_time_interval, default_initial_state, transition_matrix
 
@@ -11,11 +9,11 @@ def process_dataframes(df, demographic_info):
     # Define the number of rows for each matrix
     matrix_rows = 7
 
-    # Split the DataFrame into separate matrices
-    matrices = [df[i:i + matrix_rows] for i in range(0, df.shape[0], matrix_rows)]
+    # Convert the DataFrame once and stack it into (matrix, row, column) order
+    matrices = df.to_numpy().reshape(-1, matrix_rows, df.shape[1]).tolist()
 
     # Assign each matrix to a label in a dictionary
-    matrices_dict = {label: matrix.values.tolist() for label, matrix in zip(matrix_labels, matrices)}
+    matrices_dict = dict(zip(matrix_labels, matrices))
 
     # Print out all the matrices
     # for label, matrix in matrices_dict.items():
@@ -42,19 +40,19 @@ def process_dataframes(df, demographic_info):
         demographic_info["Is_Vaccinated"].iloc[0]
     )
 
-    output_dict = {}
-    for state, total_time_steps in simulation_data:
-        output_dict[state] = total_time_steps
+    # Later visits to the same state overwrite earlier ones
+    output_dict = dict(simulation_data)
 
     return output_dict
 
-# Read the entire CSV file into a pandas DataFrame
-df = pd.read_csv('matrices.csv', header=None)
+if __name__ == '__main__':
+    # Read the entire CSV file into a pandas DataFrame
+    df = pd.read_csv('matrices.csv', header=None)
 
-# Read the demographic info from the CSV file
-demo_cols = ["Sex", "Age", "Is_Vaccinated"]
-demographic_info = pd.read_csv('demographic_info.csv', names=demo_cols)
-result_dict = process_dataframes(df, demographic_info)
+    # Read the demographic info from the CSV file
+    demo_cols = ["Sex", "Age", "Is_Vaccinated"]
+    demographic_info = pd.read_csv('demographic_info.csv', names=demo_cols)
+    result_dict = process_dataframes(df, demographic_info)
 
-# Print the result dictionary
-print(result_dict)
\ No newline at end of file
+    # Print the result dictionary
+    print(result_dict)
\ No newline at end of file
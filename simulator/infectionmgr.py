@@ -17,34 +17,44 @@ class InfectionManager:
         if file == None:
             print(f'infected: {[i.id for i in self.infected]}')
         else:
-            file.write(f'====== TIMESTEP {curtime} ======\n')
-            file.write(f'delta: {[i.id for i in self.infected if i.states.get("delta") != None]}\n')
-            file.write(f'omicron: {[i.id for i in self.infected if i.states.get("omicron") != None]}\n')
+            # Split the infected by disease in a single pass
+            delta = []
+            omicron = []
+            for i in self.infected:
+                if i.states.get("delta") != None:
+                    delta.append(i.id)
+                if i.states.get("omicron") != None:
+                    omicron.append(i.id)
+            
+            file.write(f'====== TIMESTEP {curtime} ======\ndelta: {delta}\nomicron: {omicron}\n')
         
         for i in self.infected:
             i.update_state(curtime)
         
+        # Buffer infection messages and emit them once at the end of the timestep
+        log = []
+        
         for i in self.infected:
+            # Ignore those who cannot infect others, without walking their location
+            infectious = [disease for disease, state in i.states.items() if InfectionState.INFECTIOUS in state]
+            if len(infectious) == 0:
+                continue
+            
             for p in i.location.population:
                 if i == p:
                     continue
                 
                 new_infections = []
 
-                for disease, state in i.states.items():   
-                    # Ignore those who cannot infect others
-                    if InfectionState.INFECTIOUS not in state:
-                        continue
-                            
+                for disease in infectious:
                     # Ignore those already infected, hospitalized, or recovered
                     if p.states.get(disease) != None and InfectionState.INFECTED in p.states[disease]:
                         continue
                     
-                    # Repeat the probability the number of timesteps we passed over the interval
-                    for _ in range(num_timesteps):
-                        if random.random() < probability_model(i, p):
-                            new_infections.append(disease)
-                            break # We can't re-infect someone
+                    # Chance of at least one infection over the num_timesteps intervals we passed over,
+                    # drawn once instead of repeating the per-interval trial
+                    if random.random() < 1 - (1 - probability_model(i, p)) ** num_timesteps:
+                        new_infections.append(disease)
                 
                 for disease in new_infections:
                     # If a person is infected with more than one disease at the same time
@@ -58,16 +68,18 @@ class InfectionManager:
                         p.states[disease] = InfectionState.INFECTED
                         self.create_timeline(p, disease, curtime)
                         
-                        if file == None:
-                            print(f'{i.id} infected {p.id} @ location {p.location.id} w/ {disease}')
-                        else:
-                            file.write(f'{i.id} infected {p.id} @ location {p.location.id} w/ {disease}\n')
+                        log.append(f'{i.id} infected {p.id} @ location {p.location.id} w/ {disease}')
                         continue
                     
                     # TODO: Handle case where a person is infected by multiple diseases at once
                     p.state = InfectionState.INFECTED
                     print(f'{i.id} infected {p.id} @ location {p.location.id}')
-
+        
+        if len(log) > 0:
+            if file == None:
+                print('\n'.join(log))
+            else:
+                file.write('\n'.join(log) + '\n')
         
     # When will this person turn from infected to infectious? And later symptomatic? Hospitalized?
     def create_timeline(self, person, disease, curtime):
@@ -1,7 +1,4 @@
-import numpy as np
-import pandas as pd
 import random
-import yaml
 import json
 
 from enum import Flag, Enum
@@ -96,7 +93,14 @@ class Population:
         self.total_count = len(self.population)
     
     def remove_member(self, person_id):
-        self.population = [x for x in self.population if x.id != person_id]
+        '''
+        Removes member from the population in place (a person is only ever a member once)
+        @param person_id = id of the person to be removed
+        '''
+        for i, x in enumerate(self.population):
+            if x.id == person_id:
+                del self.population[i]
+                break
         self.total_count = len(self.population)
         
 class Household(Population):
@@ -127,6 +131,13 @@ class Facility(Population):
     if ran(not imported), yields household assignment values
 '''
 if __name__== '__main__':
+    # Only needed to generate households; kept out of the import path of the simulator
+    import pandas as pd
+    import yaml
+    
+    # Household types made up of a two-adult couple
+    couple_types = frozenset(['married', 'opposite_sex', 'same_sex'])
+    
     def create_households(pop_data, households, cbg):
         result = []
         '''
@@ -153,7 +164,7 @@ if __name__== '__main__':
             age_percent = pop_data['age_percent']
             age_group = random.choices(pop_data['age_groups'], age_percent)[0]
         
-        if type == 'married' or type == 'same_sex' or type == 'opposite_sex':
+        if type in couple_types:
             ages = random.choices(range(age_group, age_group + 10), k=2)
             sexes = [ 0, 1 ]
             
@@ -200,8 +211,9 @@ if __name__== '__main__':
         populations = 0
         households = 0
         for i in cluster:
-            populations += int(census_df[census_df.census_block_group == int(i)].values[0][1])
-            households += int(census_df[census_df.census_block_group == int(i)].values[0][2])
+            row = census_df.loc[int(i)]
+            populations += int(row['population'])
+            households += int(row['households'])
 
         return populations, households
 
@@ -211,22 +223,19 @@ if __name__== '__main__':
     with open('population_info.yaml', mode="r", encoding="utf-8") as file:
         pop_data = yaml.full_load(file)
 
-    # Reading Census Information
-    census_df = pd.read_csv('cbg_populations.csv')
+    # Reading Census Information, indexed by CBG for direct lookups
+    census_df = pd.read_csv('cbg_populations.csv', index_col='census_block_group')
 
     # read clusters into string array in order to easier census search
     cluster_df = pd.read_csv('clusters.csv')
-    clusters = [str(i) for i in list(cluster_df['cbgs'])]
+    clusters = cluster_df['cbgs'].astype(str).tolist()
 
     household_list = []
 
     # get number of households
     for cbg in clusters:
         _, household = create_pop_from_cluster([cbg], census_df)
-        household_list.append(create_households(pop_data, household, cbg))
-    
-    # Flatten list
-    household_list = [item for sublist in household_list for item in sublist]
+        household_list.extend(create_households(pop_data, household, cbg))
     
     # Dump people and house data into new papdata.json file
     with open('papdata.json', 'w', encoding='utf-8') as f:
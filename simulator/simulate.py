@@ -1,5 +1,6 @@
 from pap import Person, Household, Facility, InfectionState
 from infectionmgr import *
+from collections import deque
 import json
 
 # TODO: A way for users to call for interventions in the population
@@ -15,33 +16,44 @@ class DiseaseSimulator:
         self.people = []
         self.households = []            # list of all houses
         self.facilities = []
+        
+        # id -> object indexes so lookups don't scan the lists (first added wins)
+        self.people_by_id = {}
+        self.households_by_id = {}
+        self.facilities_by_id = {}
     
     def add_person(self, person):
         self.people.append(person)
+        self.people_by_id.setdefault(person.id, person)
         
     def get_person(self, id):
-        return next((p for p in self.people if p.id == id), None)
+        return self.people_by_id.get(id)
     
     def add_household(self, household):
         self.households.append(household)
+        self.households_by_id.setdefault(household.id, household)
     
     def get_household(self, id):
-        return next((h for h in self.households if h.id == id), None)
+        return self.households_by_id.get(id)
     
     def add_facility(self, facility):
         self.facilities.append(facility)
+        self.facilities_by_id.setdefault(facility.id, facility)
     
     def get_facility(self, id):
-        return next((f for f in self.facilities if f.id == id), None)
+        return self.facilities_by_id.get(id)
 
 def move_people(simulator, items, is_household):
+    get_place = simulator.get_household if is_household else simulator.get_facility
+    get_person = simulator.get_person
+    
     for id, people in items:
-        place = simulator.get_household(id) if is_household else simulator.get_facility(id)
+        place = get_place(id)
         if place is None:
             raise Exception(f"Place {id} was not found in the simulator data ({is_household})")
             
         for person_id in people:
-            person = simulator.get_person(person_id)
+            person = get_person(person_id)
             if person is None:
                 raise Exception(f"Person {person_id} was not found in the simulator data")
             
@@ -99,14 +111,16 @@ if __name__ == '__main__':
         patterns = json.load(file)
 
     last_timestep = 0
-    timestamps = list(patterns.keys())
+    
+    # Parse each timestamp once and consume them from the front in O(1)
+    timestamps = deque((int(timestamp), timestamp) for timestamp in patterns.keys())
     
     with open('simulator_results.txt', 'w') as file:
         while len(timestamps) > 0:
             #print(f'Running movement simulator for timestep {last_timestep}')
             
-            if last_timestep >= int(timestamps[0]):        
-                data = patterns[timestamps[0]]
+            if last_timestep >= timestamps[0][0]:
+                data = patterns[timestamps[0][1]]
                 
                 # Move people to homes for this timestep
                 move_people(simulator, data['homes'].items(), True)
@@ -114,8 +128,8 @@ if __name__ == '__main__':
                 # Move people to facilities for this timestep
                 move_people(simulator, data['places'].items(), False)
                 
-                timestamps.pop(0)
-                #print(f'Completed movement for timestep {timestamps.pop(0)}')  
+                timestamps.popleft()
+                #print(f'Completed movement for timestep {timestamps.popleft()[1]}')  
             
             infectionmgr.run_model(4, file, last_timestep)
             